@@ -28,19 +28,41 @@ space_pat = re.compile(" ")
 
 class ExtendedLesk:
     
-    def __init__(self, relations_loc, stopwords=None):
+    def __init__(self, relations_loc, stopwords=None, unique_synsets=False, max_fanout=None, max_synsets=None, max_senses=None):
         """
             Initialize the Extended Lesk algorithm
             
+            By default, relation chains are expanded exactly as in
+            WordNet::Similarity. Setting unique_synsets, max_fanout, or
+            max_synsets bounds the size of each expansion step (e.g. "hypo"),
+            which greatly reduces the runtime for highly connected synsets at
+            the cost of slightly different relatedness scores. These options
+            do not affect "glos", "example", or "syns" applied directly to the
+            input senses, so relations such as glos-glos still grow with the
+            number of senses. Use max_senses to bound those as well.
+            
             :param relations_loc: the location of a WordNet::Similarity relations file
             :type relations_loc: str
             :param stopwords: set of stopwords to be excluded from beginning/end of overlaps. If None, NLTK English stopwords are used.
             :type stopwords: list(str)
-            :param cache: whether results should be cached
-            :type cache: bool
+            :param unique_synsets: whether repeated synsets should be removed at each step of a relation chain
+            :type unique_synsets: bool
+            :param max_fanout: maximum number of related synsets to take from each synset at each step. None means no limit
+            :type max_fanout: int
+            :param max_synsets: maximum number of synsets returned by each step. None means no limit
+            :type max_synsets: int
+            :param max_senses: maximum number of input senses to consider for each word or group of synsets. None means no limit
+            :type max_senses: int
+            
+            :raises: ValueError
         """
         #TODO: make relations optional
-        self.relations = read_relation_file(relations_loc)
+        self.relations = read_relation_file(relations_loc, unique=unique_synsets, max_fanout=max_fanout, max_synsets=max_synsets)
+        
+        if (max_senses is not None) and (max_senses < 1):
+            raise ValueError("max_senses must be at least 1 or None; got {}".format(max_senses))
+        self.max_senses = max_senses
+        
         if stopwords == None:
             self.stopwords = set(sw.words("english"))
         else:
@@ -151,6 +173,11 @@ class ExtendedLesk:
             :return: Extended Lesk relatedness score
             :rtype: flaot
         """
+        if self.max_senses != None:
+            #only keep the first senses. wn.synsets() returns the most frequent senses first
+            synsets_a = list(synsets_a)[:self.max_senses]
+            synsets_b = list(synsets_b)[:self.max_senses]
+        
         relatedness_score = 0
         
         for a_funcs, b_funcs, weight in self.relations:
@@ -191,20 +218,85 @@ class ExtendedLesk:
         
 if __name__ == '__main__':
     import pickle
+    import sys
     import timeit
+    from wordnet_wrappers import get_hyponyms, concat_definitions
 
-    relations_file = "lesk-relation.dat"
+    relations_file = sys.argv[1] if len(sys.argv) > 1 else "lesk-relation.dat"
+    word_pairs_file = sys.argv[2] if len(sys.argv) > 2 else "d:/git/HumourDetection/HumourDetection/src/word_associations/features/usf/word_pairs.pkl"
     
-    with open("d:/git/HumourDetection/HumourDetection/src/word_associations/features/usf/word_pairs.pkl", "rb") as wp_file:
+    with open(word_pairs_file, "rb") as wp_file:
         wp = pickle.load(wp_file, encoding="latin1")
     wn.ensure_loaded()
     print ("starting")
 #     el = ExtendedLesk(relations_file)
 #     print(timeit.timeit("[el.getWordRelatedness(a, b) for a,b in wp[:10]]", "from __main__ import wp,el"))
-    el = ExtendedLesk(relations_file, cache=False)
+    el = ExtendedLesk(relations_file)
     print(el.getWordRelatedness("car", "bus"))
 #     print(timeit.timeit("[el.getWordRelatedness(a, b) for a,b in wp[:10]]", "from __main__ import wp,el", number=100))
     print(timeit.timeit("el.getWordRelatedness('car','bus')", "from __main__ import wp,el", number=1000))
     
 #     for a,b in wp[:100]:
-#         print("{}-{}: {}".format(a,b,el.getWordRelatedness(a, b)))
\ No newline at end of file
+#         print("{}-{}: {}".format(a,b,el.getWordRelatedness(a, b)))
+    
+    #compare bounded relation expansion against the default behaviour
+    expansion_kwargs = {"unique_synsets" : True, "max_fanout" : 10, "max_synsets" : 50}
+    bounded_els = [("bounded", ExtendedLesk(relations_file, **expansion_kwargs)),
+                   ("bounded, max_senses=10", ExtendedLesk(relations_file, max_senses=10, **expansion_kwargs))]
+    sample = wp[:1000]
+    repeats = 3
+    
+    for label, bounded_el in bounded_els:
+        print("\n{}: {}".format(label, expansion_kwargs))
+        if bounded_el.max_senses == None:
+            print("note: glos/example/syns applied directly to the input senses are not bounded")
+        
+        #warm up both scorers so neither benefits from caches or lazy loading filled by the other
+        for a,b in sample:
+            el.getWordRelatedness(a, b)
+            bounded_el.getWordRelatedness(a, b)
+        
+        results = []
+        for i, (a,b) in enumerate(sample):
+            times = {el : [], bounded_el : []}
+            scores = {}
+            for r in range(repeats):
+                #alternate which scorer runs first
+                order = (el, bounded_el) if (i + r) % 2 == 0 else (bounded_el, el)
+                for scorer in order:
+                    start = timeit.default_timer()
+                    scores[scorer] = scorer.getWordRelatedness(a, b)
+                    times[scorer].append(timeit.default_timer() - start)
+            
+            results.append((min(times[el]), min(times[bounded_el]), scores[el], scores[bounded_el], a, b))
+        
+        changed = [r for r in results if r[2] != r[3]]
+        #relative change is undefined when the default score is 0
+        relative_changes = [abs(r[2]-r[3])/r[2] for r in results if r[2] != 0]
+        changed_relative_changes = [abs(r[2]-r[3])/r[2] for r in changed if r[2] != 0]
+        
+        print("{} of {} scores changed".format(len(changed), len(results)))
+        print("{} changed scores had a default score of 0".format(len(changed) - len(changed_relative_changes)))
+        if relative_changes:
+            print("mean relative change over all pairs: {:.4f}".format(sum(relative_changes)/len(relative_changes)))
+        if changed_relative_changes:
+            print("mean relative change over changed pairs: {:.4f}".format(sum(changed_relative_changes)/len(changed_relative_changes)))
+        print("largest absolute change: {}".format(max(abs(r[2]-r[3]) for r in results)))
+        print("max latency: default {:.4f}s, bounded {:.4f}s".format(max(r[0] for r in results), max(r[1] for r in results)))
+        print("slowest pairs:")
+        for default_time, bounded_time, default_score, bounded_score, a, b in sorted(results, reverse=True)[:10]:
+            print("{}-{}: default {} ({:.4f}s), bounded {} ({:.4f}s)".format(a, b, default_score, default_time, bounded_score, bounded_time))
+    
+    #relation files' "hypo" currently maps to get_holonyms, so time hypo(hypo) on hub synsets directly
+    expansion_kwargs = {"unique" : True, "max_fanout" : 10, "max_synsets" : 50}
+    print("\nglos(hypo(hypo)) on hub synsets: {}".format(expansion_kwargs))
+    for hub_a, hub_b in (("entity.n.01", "person.n.01"), ("person.n.01", "organism.n.01"), ("person.n.01", "animal.n.01")):
+        for label, kwargs in (("default", {}), ("bounded", expansion_kwargs)):
+            texts = []
+            start = timeit.default_timer()
+            for hub in (hub_a, hub_b):
+                hyponyms = get_hyponyms(get_hyponyms([wn.synset(hub)], **kwargs), **kwargs)
+                texts.append((len(hyponyms), concat_definitions(hyponyms)))
+            score = el.getTextOverlapScore(texts[0][1], texts[1][1])
+            elapsed = timeit.default_timer() - start
+            print("{}-{} {}: {}/{} synsets, {}/{} tokens, score {} ({:.4f}s)".format(hub_a, hub_b, label, texts[0][0], texts[1][0], len(texts[0][1]), len(texts[1][1]), score, elapsed))
@@ -6,6 +6,7 @@ Created on Nov 27, 2017
 from wordnet_wrappers import get_also_sees, get_attributes, concat_examples,\
     concat_definitions, get_hypernyms, get_holonyms, get_meronyms,\
     get_pertainyms, get_similar_tos, concat_lemmas
+from functools import partial
 
 WORDNET_SIM_FUNC_MAP = {"also" : get_also_sees,
                          "attr" : get_attributes,
@@ -20,15 +21,35 @@ WORDNET_SIM_FUNC_MAP = {"also" : get_also_sees,
                          "syns" : concat_lemmas
                          }
 
-def read_relation_file(file_loc):
+#WordNet::Similarity functions which return text rather than a list of synsets
+_TEXT_FUNCS = ("glos", "example", "syns")
+
+def read_relation_file(file_loc, unique=False, max_fanout=None, max_synsets=None):
     '''
         Utility method for reading WordNet::Similarity relation
         files and using them with this library.
         
         see: http://search.cpan.org/dist/WordNet-Similarity/lib/WordNet/Similarity/extended_lesk.pm#RELATION_FILE_FORMAT
         
+        By default every relation function behaves like WordNet::Similarity.
+        Setting unique, max_fanout, or max_synsets makes every synset-returning
+        function in each chain (e.g. each "hypo" in "hypo(hypo)") remove
+        repeated synsets and/or truncate its output. This keeps relation
+        chains on highly connected synsets from producing very long texts, at
+        the cost of no longer exactly matching WordNet::Similarity's scores.
+        
+        Functions which return text ("glos", "example", and "syns") are never
+        bounded. A chain such as glos-glos is applied directly to the input
+        senses, so its length depends only on how many senses are passed in.
+        
         :param file_loc: the location of the relation file to be read
         :type relation_loc: str
+        :param unique: whether repeated synsets should be removed at each step of a relation chain
+        :type unique: bool
+        :param max_fanout: maximum number of related synsets to take from each synset at each step. None means no limit
+        :type max_fanout: int
+        :param max_synsets: maximum number of synsets returned by each step. None means no limit
+        :type max_synsets: int
         
         :returns: relation chains to be compared
         :rtype: tuple(tuple(func), tuple(func), float)
@@ -36,6 +57,15 @@ def read_relation_file(file_loc):
         :raises: ValueError
     '''
     
+    for cap in (max_fanout, max_synsets):
+        if (cap is not None) and (cap < 1):
+            raise ValueError("max_fanout and max_synsets must be at least 1 or None; got {}".format(cap))
+    
+    #only bind the expansion options if they're needed. This keeps the default behaviour as fast as possible
+    expand_kwargs = {}
+    if unique or (max_fanout is not None) or (max_synsets is not None):
+        expand_kwargs = {"unique" : unique, "max_fanout" : max_fanout, "max_synsets" : max_synsets}
+    
     with open(file_loc, "r") as relation_file:
         header = relation_file.readline()
         
@@ -89,21 +119,21 @@ def read_relation_file(file_loc):
             a_funcs = []
             b_funcs = []
             try:
-                for a_func in a_func_strs:
-                    #push the relevant WordNet Wrapper function into the chain
-                    a_funcs.append(WORDNET_SIM_FUNC_MAP[a_func])
-                
-                for b_func in b_func_strs:
-                    #push the relevant WordNet Wrapper function into the chain
-                    b_funcs.append(WORDNET_SIM_FUNC_MAP[b_func])
+                for func_strs, funcs in ((a_func_strs, a_funcs), (b_func_strs, b_funcs)):
+                    for func_str in func_strs:
+                        #push the relevant WordNet Wrapper function into the chain
+                        func = WORDNET_SIM_FUNC_MAP[func_str]
+                        if expand_kwargs and (func_str not in _TEXT_FUNCS):
+                            func = partial(func, **expand_kwargs)
+                        funcs.append(func)
             except KeyError as e:
                 raise ValueError("Relation file does is not in WordNet::Similarity format; line '{}' contains an unknown function.\n{}\n\nPlease see http://search.cpan.org/dist/WordNet-Similarity/lib/WordNet/Similarity/extended_lesk.pm#RELATION_FILE_FORMAT\n\n{}".format(line, file_loc, str(e))) #TODO: is ValueError the appropriate exception?
             
             #check if the final function returns a list of synsets
-            if a_func_strs[-1].lower() not in ("glos", "example", "syns"):
+            if a_func_strs[-1].lower() not in _TEXT_FUNCS:
                 #add a "glos" on the end
                 a_funcs.append(concat_definitions)
-            if b_func_strs[-1].lower() not in ("glos", "example", "syns"):
+            if b_func_strs[-1].lower() not in _TEXT_FUNCS:
                 b_funcs.append(concat_definitions)
                 
             #add to the list of relation comparisons to make
@@ -96,12 +96,72 @@ def _get_pertainyms(synset):
     """
     return [pertainym.synset() for lemma in _get_lemmas(synset) for pertainym in lemma.pertainyms()]
 
+@lru_cache(maxsize=_cache_size)
+def _get_all_also_sees(synset):
+    """
+    Method for getting the also_sees of a synset and of all its lemmas
+    """
+    #WordNet::Similarity's "also" is inconsistent
+    #It returns the also_sees from breathe.v.01's lemmas
+    #but it doesn't return the also_sees from refresh.v.04's
+    #For simplicity, we return all also_sees whether they're from synsets or the synsets' lemmas
+    also_sees = list(_get_also_sees(synset)) #copy to avoid editing the cached list in place
+    for lemma in _get_lemmas(synset):
+        for also_see in _get_also_sees(lemma):
+            also_sees.append(also_see.synset())
+    return also_sees
+
 
 
 
 
 ######################### WordNet Functions #############################
 
+def _expand_synsets(synsets, get_related, unique=False, max_fanout=None, max_synsets=None):
+    """
+    Method for applying a per-synset relation function to a list of synsets.
+    
+    By default the related synsets are simply concatenated, duplicates and
+    all, to match WordNet::Similarity. If unique is True, repeated synsets are
+    dropped, keeping the first occurrence. max_fanout limits the number of
+    synsets taken from each input synset and max_synsets limits the total
+    number returned. Truncation always keeps the earliest synsets, so results
+    are deterministic.
+    
+    Raises ValueError if max_fanout or max_synsets is less than 1.
+    """
+    related=[]
+    
+    if not unique and max_fanout is None and max_synsets is None:
+        #default behaviour. Keep this path as cheap as possible
+        for synset in synsets:
+            related += get_related(synset)
+        return related
+    
+    for cap in (max_fanout, max_synsets):
+        if (cap is not None) and (cap < 1):
+            raise ValueError("max_fanout and max_synsets must be at least 1 or None; got {}".format(cap))
+    
+    seen = set()
+    for synset in synsets:
+        fanout = 0
+        for related_synset in get_related(synset):
+            if max_fanout is not None and fanout >= max_fanout:
+                break
+            if unique:
+                if related_synset in seen:
+                    #duplicates don't count towards the fan-out
+                    continue
+                seen.add(related_synset)
+            
+            related.append(related_synset)
+            fanout = fanout + 1
+            
+            if max_synsets is not None and len(related) >= max_synsets:
+                return related
+    
+    return related
+
 def concat_definitions(synsets):
     '''
         Takes a list of synsets and combines their definitions into a single
@@ -181,157 +241,163 @@ def concat_lemmas(synsets):
     
     return lemmas
 
-def get_also_sees(synsets):
+def get_also_sees(synsets, unique=False, max_fanout=None, max_synsets=None):
     '''
         Takes a list of synsets, finds all their also_sees, and returns them as
         a list of Synsets
         
         :param synsets: list of synsets to concatenate
         :type synsets: iterable(nltk.corpus.wordnet.Synset)
+        :param unique: whether repeated synsets should be removed
+        :type unique: bool
+        :param max_fanout: maximum number of synsets to take from each synset. None means no limit
+        :type max_fanout: int
+        :param max_synsets: maximum number of synsets to return. None means no limit
+        :type max_synsets: int
         
         :return: all synsets' also_sees' definitions as a list of individual words
         :rtype: list(nltk.corpus.wordnet.Synset)
     '''
     
-    #WordNet::Similarity's "also" is inconsistent
-    #It returns the also_sees from breathe.v.01's lemmas
-    #but it doesn't return the also_sees from refresh.v.04's
-    #For simplicity, we return all also_sees whether they're from synsets or the synsets' lemmas
-    
-    also_sees=[] #TODO: should I use a set to avoid repeat definitions?
-    
-    for synset in synsets:
-        #add synset-level also_sees
-        also_sees += _get_also_sees(synset)
-        
-        #add lemma-level also_sees
-        for lemma in _get_lemmas(synset):
-            for also_see in _get_also_sees(lemma):
-                also_sees.append(also_see.synset())
-    
-    return also_sees
+    return _expand_synsets(synsets, _get_all_also_sees, unique, max_fanout, max_synsets)
 
-def get_hypernyms(synsets):
+def get_hypernyms(synsets, unique=False, max_fanout=None, max_synsets=None):
     '''
         Takes a list of synsets, finds all their hypernnyms, and returns them as
         a list of Synsets
         
         :param synsets: list of synsets to concatenate
         :type synsets: iterable(nltk.corpus.wordnet.Synset)
+        :param unique: whether repeated synsets should be removed
+        :type unique: bool
+        :param max_fanout: maximum number of synsets to take from each synset. None means no limit
+        :type max_fanout: int
+        :param max_synsets: maximum number of synsets to return. None means no limit
+        :type max_synsets: int
         
         :return: all synsets' hypernyms' definitions as a list of individual words
         :rtype: list(nltk.corpus.wordnet.Synset)
     '''
     
-    hypernyms=[] #TODO: should I use a set to avoid repeat definitions?
-    for synset in synsets:
-        #Perl library WordNet::Similarity doesn't seem to differentiate hypernyms and instance_hypernyms. Neither should we.
-        hypernyms += _get_hypernyms(synset)
-    return hypernyms
+    #Perl library WordNet::Similarity doesn't seem to differentiate hypernyms and instance_hypernyms. Neither should we.
+    return _expand_synsets(synsets, _get_hypernyms, unique, max_fanout, max_synsets)
 
-def get_hyponyms(synsets):
+def get_hyponyms(synsets, unique=False, max_fanout=None, max_synsets=None):
     '''
         Takes a list of synsets, finds all their hyponnyms, and returns them as
         a list of Synsets
         
         :param synsets: list of synsets to concatenate
         :type synsets: iterable(nltk.corpus.wordnet.Synset)
+        :param unique: whether repeated synsets should be removed
+        :type unique: bool
+        :param max_fanout: maximum number of synsets to take from each synset. None means no limit
+        :type max_fanout: int
+        :param max_synsets: maximum number of synsets to return. None means no limit
+        :type max_synsets: int
         
         :return: all synsets' hyponyms' definitions as a list of individual words
         :rtype: list(nltk.corpus.wordnet.Synset)
     '''
     
-    hyponyms=[] #TODO: should I use a set to avoid repeat definitions?
-    for synset in synsets:
-        #Perl library WordNet::Similarity doesn't seem to differentiate hyponyms and instance_hyponyms. Neither should we.
-        hyponyms += _get_hyponyms(synset)
-    return hyponyms
+    #Perl library WordNet::Similarity doesn't seem to differentiate hyponyms and instance_hyponyms. Neither should we.
+    return _expand_synsets(synsets, _get_hyponyms, unique, max_fanout, max_synsets)
 
-def get_holonyms(synsets):
+def get_holonyms(synsets, unique=False, max_fanout=None, max_synsets=None):
     '''
         Takes a list of synsets, finds all their holonyms, and returns them as
         a list of Synsets
         
         :param synsets: list of synsets to concatenate
         :type synsets: iterable(nltk.corpus.wordnet.Synset)
+        :param unique: whether repeated synsets should be removed
+        :type unique: bool
+        :param max_fanout: maximum number of synsets to take from each synset. None means no limit
+        :type max_fanout: int
+        :param max_synsets: maximum number of synsets to return. None means no limit
+        :type max_synsets: int
         
         :return: all synsets' holonyms' definitions as a list of individual words
         :rtype: list(nltk.corpus.wordnet.Synset)
     '''
     
-    holonyms=[] #TODO: should I use a set to avoid repeat definitions?
     #Perl library WordNet::Similarity doesn't seem to differentiate member_holonyms, part_holonyms, and substance_holonyms. Neither should we.
-    for synset in synsets:
-        #Perl library WordNet::Similarity doesn't seem to differentiate member_holonyms, part_holonyms, and substance_holonyms. Neither should we.
-        holonyms += _get_holonyms(synset)
-    
-    return holonyms
+    return _expand_synsets(synsets, _get_holonyms, unique, max_fanout, max_synsets)
 
-def get_meronyms(synsets):
+def get_meronyms(synsets, unique=False, max_fanout=None, max_synsets=None):
     '''
         Takes a list of synsets, finds all their meronyms, and returns them as 
         a list of Synsets
         
         :param synsets: list of synsets to concatenate
         :type synsets: iterable(nltk.corpus.wordnet.Synset)
+        :param unique: whether repeated synsets should be removed
+        :type unique: bool
+        :param max_fanout: maximum number of synsets to take from each synset. None means no limit
+        :type max_fanout: int
+        :param max_synsets: maximum number of synsets to return. None means no limit
+        :type max_synsets: int
         
         :return: all synsets' meronyms' definitions as a list of individual words
         :rtype: list(nltk.corpus.wordnet.Synset)
     '''
     
-    meronyms=[] #TODO: should I use a set to avoid repeat definitions?
-    
-    for synset in synsets:
-        #Perl library WordNet::Similarity doesn't seem to differentiate member_meronyms, part_meronyms, and substance_meronyms. Neither should we.
-        meronyms += _get_meronyms(synset)
-
-    return meronyms
+    #Perl library WordNet::Similarity doesn't seem to differentiate member_meronyms, part_meronyms, and substance_meronyms. Neither should we.
+    return _expand_synsets(synsets, _get_meronyms, unique, max_fanout, max_synsets)
 
-def get_attributes(synsets):
+def get_attributes(synsets, unique=False, max_fanout=None, max_synsets=None):
     '''
         Takes a list of synsets, finds all their attributes,
         and returns them as a list of Synsets
         
         :param synsets: list of synsets to concatenate
         :type synsets: iterable(nltk.corpus.wordnet.Synset)
+        :param unique: whether repeated synsets should be removed
+        :type unique: bool
+        :param max_fanout: maximum number of synsets to take from each synset. None means no limit
+        :type max_fanout: int
+        :param max_synsets: maximum number of synsets to return. None means no limit
+        :type max_synsets: int
         
         :return: all synsets' attributes' definitions as a list of individual words
         :rtype: list(nltk.corpus.wordnet.Synset)
     '''
     
-    attributes=[] #TODO: should I use a set to avoid repeat definitions?
-    
-    for synset in synsets:
-        attributes += _get_attributes(synset)
-    
-    return attributes
+    return _expand_synsets(synsets, _get_attributes, unique, max_fanout, max_synsets)
 
-def get_similar_tos(synsets):
+def get_similar_tos(synsets, unique=False, max_fanout=None, max_synsets=None):
     '''
         Takes a list of synsets, finds all their similar_tos, and returns them
         as a list of Synsets
         
         :param synsets: list of synsets to concatenate
         :type synsets: iterable(nltk.corpus.wordnet.Synset)
+        :param unique: whether repeated synsets should be removed
+        :type unique: bool
+        :param max_fanout: maximum number of synsets to take from each synset. None means no limit
+        :type max_fanout: int
+        :param max_synsets: maximum number of synsets to return. None means no limit
+        :type max_synsets: int
         
         :return: all synsets' similar_tos' definitions as a list of individual words
         :rtype: list(nltk.corpus.wordnet.Synset)
     '''
     
-    similar_tos=[] #TODO: should I use a set to avoid repeat definitions?
-    
-    for synset in synsets:
-        similar_tos += _get_similar_tos(synset)
-    
-    return similar_tos
+    return _expand_synsets(synsets, _get_similar_tos, unique, max_fanout, max_synsets)
 
-def get_pertainyms(synsets):
+def get_pertainyms(synsets, unique=False, max_fanout=None, max_synsets=None):
     '''
         Takes a list of synsets, finds all their pertainyms, and returns them
         as a list of Synsets
         
         :param synsets: list of synsets to concatenate
         :type synsets: iterable(nltk.corpus.wordnet.Synset)
+        :param unique: whether repeated synsets should be removed
+        :type unique: bool
+        :param max_fanout: maximum number of synsets to take from each synset. None means no limit
+        :type max_fanout: int
+        :param max_synsets: maximum number of synsets to return. None means no limit
+        :type max_synsets: int
         
         :return: all synsets' pertainyms' definitions as a list of individual words
         :rtype: list(nltk.corpus.wordnet.Synset)
@@ -339,8 +405,4 @@ def get_pertainyms(synsets):
     
     #TODO: hardly.r.02 doesn't return any pertainyms in WQordNet::Similarity despite them being in NLTK
     
-    pertainyms=[] #TODO: should I use a set to avoid repeat definitions?
-    for synset in synsets:
-        pertainyms += _get_pertainyms(synset)
-    
-    return pertainyms
\ No newline at end of file
+    return _expand_synsets(synsets, _get_pertainyms, unique, max_fanout, max_synsets)
\ No newline at end of file